@@ -6,6 +6,9 @@ import re
 
 app = Flask(__name__)
 
+# Shared converter; Text2Digits keeps no per-call state
+t2d = text2digits.Text2Digits()
+
 def text_to_number(text):
     """Convert English text number to integer"""
     # Remove any non-alphanumeric characters and convert to lowercase
@@ -26,8 +29,6 @@ def text_to_number(text):
     
     # Try using text2digits for more complex numbers
     try:
-        from text2digits import text2digits
-        t2d = text2digits.Text2Digits()
         result = t2d.convert(text)
         if result.isdigit():
             return int(result)
@@ -62,12 +63,12 @@ def number_to_base64(number):
     try:
         # Handle zero case specially
         if number == 0:
-            return base64.b64encode(b'\x00').decode('utf-8')
+            return base64.b64encode(b'\x00').decode('ascii')
         
         # Convert integer to bytes, then encode to base64
         byte_count = (number.bit_length() + 7) // 8
         number_bytes = number.to_bytes(byte_count, byteorder='little')
-        return base64.b64encode(number_bytes).decode('utf-8')
+        return base64.b64encode(number_bytes).decode('ascii')
     except:
         raise ValueError("Unable to convert to base64")
 
@@ -1,44 +1,38 @@
 """
 Pytest configuration and fixtures for the Numeric Converter test suite.
 """
-import sys
-import os
 import pytest
-from flask import Flask
 
-# Add the api directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+@pytest.fixture(scope="session")
+def app():
+    """Import the Flask application once per session and configure it for testing."""
+    from api.index import app
+    # The view reports errors in its JSON body, so there is nothing to propagate
+    app.config.update(TESTING=True, PROPAGATE_EXCEPTIONS=False,
+                      TRAP_HTTP_EXCEPTIONS=False, DEBUG=False)
+    return app
 
-from index import app
-
-@pytest.fixture
-def client():
-    """Create a test client for the Flask application."""
-    app.config['TESTING'] = True
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a test client for the Flask application, shared across the session."""
     with app.test_client() as client:
         yield client
 
-@pytest.fixture
-def sample_numbers():
-    """Provide a set of test numbers for conversion testing."""
-    return {
-        'small': 42,
-        'medium': 1234,
-        'large': 98765,
-        'zero': 0,
-        'one': 1,
-        'negative': -42,
-        'max_byte': 255,
-        'max_short': 65535
-    }
+@pytest.fixture(scope="session")
+def call_convert(app):
+    """Call the /convert view directly inside a request context.
+
+    Skips the WSGI stack (routing, request hooks) for tests that only check
+    the JSON the view returns.
+    """
+    from api.index import convert
 
-@pytest.fixture
-def sample_text_numbers():
-    """Provide text representations of numbers for testing."""
-    return {
-        0: 'zero',
-        1: 'one',
-        42: 'forty-two',
-        123: 'one hundred and twenty-three',
-        1000: 'one thousand'
-    }
+    def _call(payload):
+        if isinstance(payload, bytes):
+            # Pre-encoded JSON body
+            kwargs = {'data': payload, 'content_type': 'application/json'}
+        else:
+            kwargs = {'json': payload}
+        with app.test_request_context('/convert', method='POST', **kwargs):
+            return convert()
+    return _call
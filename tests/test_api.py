@@ -4,178 +4,242 @@ Tests the /convert endpoint with various input combinations and error cases.
 """
 import pytest
 import json
-import base64
+import sys
+
+# base64 of 42 and 1, each as a single little-endian byte
+EXPECTED_42_B64 = 'Kg=='
+EXPECTED_1_B64 = 'AQ=='
+
+# 10**30 - 1 and its binary representation
+LARGE_NUM = '999999999999999999999999999999'
+LARGE_NUM_BINARY = bin(10**30 - 1)[2:]
+
+# Fixed request bodies, serialized once at import
+NEG42_TO_TEXT = json.dumps({'input': '-42', 'inputType': 'decimal', 'outputType': 'text'}).encode()
+NEG42_TO_BIN = json.dumps({'input': '-42', 'inputType': 'decimal', 'outputType': 'binary'}).encode()
+NEG42_TO_OCT = json.dumps({'input': '-42', 'inputType': 'decimal', 'outputType': 'octal'}).encode()
+NEG42_TO_HEX = json.dumps({'input': '-42', 'inputType': 'decimal', 'outputType': 'hexadecimal'}).encode()
+
+# (input_type, input_val, output_type, expected), with short "input->output" ids
+ZERO_CASES = [
+    pytest.param('text', 'zero', 'decimal', '0', id='text->decimal'),
+    pytest.param('decimal', '0', 'text', 'zero', id='decimal->text'),
+    pytest.param('binary', '0', 'decimal', '0', id='binary->decimal'),
+    pytest.param('octal', '0', 'decimal', '0', id='octal->decimal'),
+    pytest.param('hexadecimal', '0', 'decimal', '0', id='hexadecimal->decimal'),
+]
+LARGE_NUMBER_CASES = [
+    pytest.param('decimal', '1234', 'binary', '10011010010', id='decimal->binary'),
+    pytest.param('decimal', '1234', 'octal', '2322', id='decimal->octal'),
+    pytest.param('decimal', '1234', 'hexadecimal', '4d2', id='decimal->hexadecimal'),
+    pytest.param('decimal', '1234', 'text', 'one thousand, two hundred and thirty-four',
+                 id='decimal->text'),
+]
+
+# (start_type, intermediate_type, end_type, final_type)
+ROUNDTRIP_CASES = [
+    pytest.param('decimal', 'binary', 'binary', 'decimal', id='decimal->binary'),
+    pytest.param('decimal', 'hexadecimal', 'hexadecimal', 'decimal', id='decimal->hexadecimal'),
+    pytest.param('decimal', 'octal', 'octal', 'decimal', id='decimal->octal'),
+]
+
+# (input_type, output_type, input_value, expected) for every type combination
+CROSS_CASES = (
+    # Text conversions
+    ("text", "decimal", "zero", "0"),
+    ("text", "binary", "one", "1"),
+    ("text", "octal", "ten", "12"),
+    ("text", "hexadecimal", "one", "1"),
+    ("text", "base64", "one", EXPECTED_1_B64),
+
+    # Binary conversions
+    ("binary", "decimal", "101010", "42"),
+    ("binary", "text", "1", "one"),
+    ("binary", "octal", "101010", "52"),
+    ("binary", "hexadecimal", "101010", "2a"),
+    ("binary", "base64", "101010", EXPECTED_42_B64),
+
+    # Octal conversions
+    ("octal", "decimal", "52", "42"),
+    ("octal", "text", "1", "one"),
+    ("octal", "binary", "52", "101010"),
+    ("octal", "hexadecimal", "52", "2a"),
+    ("octal", "base64", "52", EXPECTED_42_B64),
+
+    # Decimal conversions
+    ("decimal", "text", "42", "forty-two"),
+    ("decimal", "binary", "42", "101010"),
+    ("decimal", "octal", "42", "52"),
+    ("decimal", "hexadecimal", "42", "2a"),
+    ("decimal", "base64", "42", EXPECTED_42_B64),
+
+    # Hexadecimal conversions
+    ("hexadecimal", "decimal", "2a", "42"),
+    ("hexadecimal", "text", "1", "one"),
+    ("hexadecimal", "binary", "2a", "101010"),
+    ("hexadecimal", "octal", "2a", "52"),
+    ("hexadecimal", "base64", "2a", EXPECTED_42_B64),
+
+    # Base64 conversions
+    ("base64", "decimal", EXPECTED_42_B64, "42"),
+    ("base64", "text", EXPECTED_1_B64, "one"),
+    ("base64", "binary", EXPECTED_42_B64, "101010"),
+    ("base64", "octal", EXPECTED_42_B64, "52"),
+    ("base64", "hexadecimal", EXPECTED_42_B64, "2a"),
+)
+# Intern so repeated type names and values share a single string object
+CROSS_CASES = tuple((sys.intern(a), sys.intern(b), sys.intern(c), sys.intern(d))
+                     for a, b, c, d in CROSS_CASES)
+
+# (request body, expected substring of the error message)
+ERROR_CASES = [
+    pytest.param(json.dumps({'input': '42', 'inputType': 'invalid', 'outputType': 'decimal'}).encode(),
+                 'Invalid input type', id='invalid_input_type'),
+    pytest.param(json.dumps({'input': '42', 'inputType': 'decimal', 'outputType': 'invalid'}).encode(),
+                 'Invalid output type', id='invalid_output_type'),
+    pytest.param(json.dumps({'input': 'invalid text', 'inputType': 'text', 'outputType': 'decimal'}).encode(),
+                 'Unable to convert text to number', id='invalid_text_input'),
+    pytest.param(json.dumps({'input': '123', 'inputType': 'binary', 'outputType': 'decimal'}).encode(),
+                 'invalid literal for int()', id='invalid_binary_input'),
+    pytest.param(json.dumps({'input': '89', 'inputType': 'octal', 'outputType': 'decimal'}).encode(),
+                 'invalid literal for int()', id='invalid_octal_input'),
+    pytest.param(json.dumps({'input': 'gh', 'inputType': 'hexadecimal', 'outputType': 'decimal'}).encode(),
+                 'invalid literal for int()', id='invalid_hexadecimal_input'),
+    pytest.param(json.dumps({'input': 'invalid_base64!', 'inputType': 'base64', 'outputType': 'decimal'}).encode(),
+                 'Invalid base64 input', id='invalid_base64_input'),
+    pytest.param(json.dumps({'inputType': 'decimal', 'outputType': 'text'}).encode(),
+                 "'input'", id='missing_input_field'),
+    pytest.param(json.dumps({'input': '42', 'outputType': 'text'}).encode(),
+                 "'inputType'", id='missing_input_type_field'),
+    pytest.param(json.dumps({'input': '42', 'inputType': 'decimal'}).encode(),
+                 "'outputType'", id='missing_output_type_field'),
+]
 
 
 class TestConvertEndpoint:
     """Test the /convert API endpoint."""
     
-    def test_convert_text_to_decimal(self, client):
+    def test_convert_text_to_decimal(self, call_convert):
         """Test converting text to decimal."""
-        response = client.post('/convert', 
-                             data=json.dumps({
-                                 'input': 'forty-two',
-                                 'inputType': 'text',
-                                 'outputType': 'decimal'
-                             }),
-                             content_type='application/json')
+        response = call_convert({
+            'input': 'forty-two',
+            'inputType': 'text',
+            'outputType': 'decimal'
+        })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         assert data['result'] == '42'
     
-    def test_convert_decimal_to_text(self, client):
+    def test_convert_decimal_to_text(self, call_convert):
         """Test converting decimal to text."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '42',
-                                 'inputType': 'decimal',
-                                 'outputType': 'text'
-                             }),
-                             content_type='application/json')
+        response = call_convert({
+            'input': '42',
+            'inputType': 'decimal',
+            'outputType': 'text'
+        })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         assert data['result'] == 'forty-two'
     
-    def test_convert_binary_to_hexadecimal(self, client):
+    def test_convert_binary_to_hexadecimal(self, call_convert):
         """Test converting binary to hexadecimal."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '101010',
-                                 'inputType': 'binary',
-                                 'outputType': 'hexadecimal'
-                             }),
-                             content_type='application/json')
+        response = call_convert({
+            'input': '101010',
+            'inputType': 'binary',
+            'outputType': 'hexadecimal'
+        })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         assert data['result'] == '2a'
     
-    def test_convert_hexadecimal_to_octal(self, client):
+    def test_convert_hexadecimal_to_octal(self, call_convert):
         """Test converting hexadecimal to octal."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '2a',
-                                 'inputType': 'hexadecimal',
-                                 'outputType': 'octal'
-                             }),
-                             content_type='application/json')
+        response = call_convert({
+            'input': '2a',
+            'inputType': 'hexadecimal',
+            'outputType': 'octal'
+        })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         assert data['result'] == '52'
     
-    def test_convert_decimal_to_base64(self, client):
+    def test_convert_decimal_to_base64(self, call_convert):
         """Test converting decimal to base64 with little-endian."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '42',
-                                 'inputType': 'decimal',
-                                 'outputType': 'base64'
-                             }),
-                             content_type='application/json')
+        response = call_convert({
+            'input': '42',
+            'inputType': 'decimal',
+            'outputType': 'base64'
+        })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         # Verify it's little-endian by checking against expected value
-        expected = base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8')
-        assert data['result'] == expected
+        assert data['result'] == EXPECTED_42_B64
     
-    def test_convert_base64_to_decimal(self, client):
+    def test_convert_base64_to_decimal(self, call_convert):
         """Test converting base64 to decimal with little-endian."""
-        b64_input = base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8')
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': b64_input,
-                                 'inputType': 'base64',
-                                 'outputType': 'decimal'
-                             }),
-                             content_type='application/json')
+        response = call_convert({
+            'input': EXPECTED_42_B64,
+            'inputType': 'base64',
+            'outputType': 'decimal'
+        })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         assert data['result'] == '42'
     
-    def test_convert_zero_handling(self, client):
+    @pytest.mark.parametrize("input_type,input_val,output_type,expected", ZERO_CASES)
+    def test_convert_zero_handling(self, call_convert, input_type, input_val, output_type, expected):
         """Test conversion of zero in various formats."""
-        test_cases = [
-            ('text', 'zero', 'decimal', '0'),
-            ('decimal', '0', 'text', 'zero'),
-            ('binary', '0', 'decimal', '0'),
-            ('octal', '0', 'decimal', '0'),
-            ('hexadecimal', '0', 'decimal', '0'),
-        ]
+        response = call_convert({
+            'input': input_val,
+            'inputType': input_type,
+            'outputType': output_type
+        })
         
-        for input_type, input_val, output_type, expected in test_cases:
-            response = client.post('/convert',
-                                 data=json.dumps({
-                                     'input': input_val,
-                                     'inputType': input_type,
-                                     'outputType': output_type
-                                 }),
-                                 content_type='application/json')
-            
-            data = json.loads(response.data)
-            assert response.status_code == 200
-            assert data['error'] is None
-            assert data['result'] == expected
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['error'] is None
+        assert data['result'] == expected
     
-    def test_convert_large_numbers(self, client):
+    @pytest.mark.parametrize("input_type,input_val,output_type,expected", LARGE_NUMBER_CASES)
+    def test_convert_large_numbers(self, call_convert, input_type, input_val, output_type, expected):
         """Test conversion of large numbers."""
-        test_cases = [
-            ('decimal', '1234', 'binary', '10011010010'),
-            ('decimal', '1234', 'octal', '2322'),
-            ('decimal', '1234', 'hexadecimal', '4d2'),
-            ('decimal', '1234', 'text', 'one thousand, two hundred and thirty-four'),
-        ]
+        response = call_convert({
+            'input': input_val,
+            'inputType': input_type,
+            'outputType': output_type
+        })
         
-        for input_type, input_val, output_type, expected in test_cases:
-            response = client.post('/convert',
-                                 data=json.dumps({
-                                     'input': input_val,
-                                     'inputType': input_type,
-                                     'outputType': output_type
-                                 }),
-                                 content_type='application/json')
-            
-            data = json.loads(response.data)
-            assert response.status_code == 200
-            assert data['error'] is None
-            assert data['result'] == expected
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['error'] is None
+        assert data['result'] == expected
     
-    def test_convert_negative_numbers(self, client):
+    def test_convert_negative_numbers(self, call_convert):
         """Test conversion of negative numbers."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '-42',
-                                 'inputType': 'decimal',
-                                 'outputType': 'text'
-                             }),
-                             content_type='application/json')
+        response = call_convert(NEG42_TO_TEXT)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         assert data['result'] == 'minus forty-two'
     
-    def test_convert_negative_to_binary_bug(self, client):
+    def test_convert_negative_to_binary_bug(self, call_convert):
         """Test that negative numbers convert to binary correctly (should detect bug)."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '-42',
-                                 'inputType': 'decimal',
-                                 'outputType': 'binary'
-                             }),
-                             content_type='application/json')
+        response = call_convert(NEG42_TO_BIN)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         # This should be a proper binary representation, not '-101010'
@@ -184,17 +248,11 @@ class TestConvertEndpoint:
         # Should be a valid binary string (only 0s and 1s)
         assert all(c in '01' for c in data['result']), f"Binary result should only contain 0s and 1s, got: {data['result']}"
     
-    def test_convert_negative_to_octal_bug(self, client):
+    def test_convert_negative_to_octal_bug(self, call_convert):
         """Test that negative numbers convert to octal correctly (should detect bug)."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '-42',
-                                 'inputType': 'decimal',
-                                 'outputType': 'octal'
-                             }),
-                             content_type='application/json')
+        response = call_convert(NEG42_TO_OCT)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         # This should be a proper octal representation, not '-52'
@@ -202,174 +260,45 @@ class TestConvertEndpoint:
         # Should be a valid octal string (only 0-7)
         assert all(c in '01234567' for c in data['result']), f"Octal result should only contain 0-7, got: {data['result']}"
     
-    def test_convert_negative_to_hex_bug(self, client):
+    def test_convert_negative_to_hex_bug(self, call_convert):
         """Test that negative numbers convert to hexadecimal correctly (should detect bug)."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '-42',
-                                 'inputType': 'decimal',
-                                 'outputType': 'hexadecimal'
-                             }),
-                             content_type='application/json')
+        response = call_convert(NEG42_TO_HEX)
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['error'] is None
         # This should be a proper hex representation, not '-2a'
         assert not data['result'].startswith('-'), f"Hex result should not start with '-', got: {data['result']}"
         # Should be a valid hex string (only 0-9, a-f)
         assert all(c in '0123456789abcdef' for c in data['result'].lower()), f"Hex result should only contain 0-9, a-f, got: {data['result']}"
+    
+    def test_all_conversion_combinations(self, call_convert):
+        """Test all possible input/output type combinations."""
+        failures = []
+        for input_type, output_type, input_value, expected in CROSS_CASES:
+            data = call_convert({
+                'input': input_value,
+                'inputType': input_type,
+                'outputType': output_type
+            }).get_json()
+            if data != {'result': expected, 'error': None}:
+                failures.append((input_type, output_type, input_value, data))
+        assert not failures, f"Unexpected conversions (in, out, input, response): {failures}"
 
 
 class TestErrorHandling:
     """Test error handling in the API."""
     
-    def test_invalid_input_type(self, client):
-        """Test error handling for invalid input type."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '42',
-                                 'inputType': 'invalid',
-                                 'outputType': 'decimal'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert 'Invalid input type' in data['error']
-    
-    def test_invalid_output_type(self, client):
-        """Test error handling for invalid output type."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '42',
-                                 'inputType': 'decimal',
-                                 'outputType': 'invalid'
-                             }),
-                             content_type='application/json')
+    @pytest.mark.parametrize("payload,expected", ERROR_CASES)
+    def test_error(self, client, payload, expected):
+        """Test that invalid requests report the expected error message."""
+        response = client.post('/convert', data=payload,
+                               content_type='application/json')
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['result'] is None
-        assert 'Invalid output type' in data['error']
-    
-    def test_invalid_text_input(self, client):
-        """Test error handling for invalid text input."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': 'invalid text',
-                                 'inputType': 'text',
-                                 'outputType': 'decimal'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert 'Unable to convert text to number' in data['error']
-    
-    def test_invalid_binary_input(self, client):
-        """Test error handling for invalid binary input."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '123',  # Invalid binary
-                                 'inputType': 'binary',
-                                 'outputType': 'decimal'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert 'invalid literal for int()' in data['error']
-    
-    def test_invalid_octal_input(self, client):
-        """Test error handling for invalid octal input."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '89',  # Invalid octal
-                                 'inputType': 'octal',
-                                 'outputType': 'decimal'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert 'invalid literal for int()' in data['error']
-    
-    def test_invalid_hexadecimal_input(self, client):
-        """Test error handling for invalid hexadecimal input."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': 'gh',  # Invalid hex
-                                 'inputType': 'hexadecimal',
-                                 'outputType': 'decimal'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert 'invalid literal for int()' in data['error']
-    
-    def test_invalid_base64_input(self, client):
-        """Test error handling for invalid base64 input."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': 'invalid_base64!',
-                                 'inputType': 'base64',
-                                 'outputType': 'decimal'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert 'Invalid base64 input' in data['error']
-    
-    def test_missing_input_field(self, client):
-        """Test error handling for missing input field."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'inputType': 'decimal',
-                                 'outputType': 'text'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert "'input'" in data['error']
-    
-    def test_missing_input_type_field(self, client):
-        """Test error handling for missing inputType field."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '42',
-                                 'outputType': 'text'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert "'inputType'" in data['error']
-    
-    def test_missing_output_type_field(self, client):
-        """Test error handling for missing outputType field."""
-        response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': '42',
-                                 'inputType': 'decimal'
-                             }),
-                             content_type='application/json')
-        
-        data = json.loads(response.data)
-        assert response.status_code == 200
-        assert data['result'] is None
-        assert "'outputType'" in data['error']
+        assert expected in data['error']
 
 
 class TestEdgeCases:
@@ -378,14 +307,13 @@ class TestEdgeCases:
     def test_empty_input(self, client):
         """Test handling of empty input."""
         response = client.post('/convert',
-                             data=json.dumps({
+                             json={
                                  'input': '',
                                  'inputType': 'decimal',
                                  'outputType': 'text'
-                             }),
-                             content_type='application/json')
+                             })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['result'] is None
         assert 'invalid literal for int()' in data['error']
@@ -393,68 +321,55 @@ class TestEdgeCases:
     def test_whitespace_input(self, client):
         """Test handling of whitespace-only input."""
         response = client.post('/convert',
-                             data=json.dumps({
+                             json={
                                  'input': '   ',
                                  'inputType': 'decimal',
                                  'outputType': 'text'
-                             }),
-                             content_type='application/json')
+                             })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
         assert data['result'] is None
         assert 'invalid literal for int()' in data['error']
     
+    @pytest.mark.slow
     def test_very_large_number(self, client):
         """Test handling of very large numbers."""
-        large_num = "999999999999999999999999999999"
         response = client.post('/convert',
-                             data=json.dumps({
-                                 'input': large_num,
+                             json={
+                                 'input': LARGE_NUM,
                                  'inputType': 'decimal',
                                  'outputType': 'binary'
-                             }),
-                             content_type='application/json')
+                             })
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code == 200
-        # Should either succeed or fail gracefully
-        if data['error'] is None:
-            assert data['result'] is not None
-        else:
-            assert 'Unable to convert' in data['error'] or 'invalid literal' in data['error']
+        assert data['error'] is None
+        assert data['result'] == LARGE_NUM_BINARY
     
-    def test_roundtrip_conversions(self, client):
+    @pytest.mark.parametrize("start_type,intermediate_type,end_type,final_type", ROUNDTRIP_CASES)
+    def test_roundtrip_conversions(self, client, start_type, intermediate_type,
+                                   end_type, final_type):
         """Test roundtrip conversions to ensure consistency."""
         test_value = "42"
-        conversions = [
-            ('decimal', 'binary', 'binary', 'decimal'),
-            ('decimal', 'hexadecimal', 'hexadecimal', 'decimal'),
-            ('decimal', 'octal', 'octal', 'decimal'),
-        ]
         
-        for start_type, intermediate_type, end_type, final_type in conversions:
-            # First conversion
-            response1 = client.post('/convert',
-                                  data=json.dumps({
-                                      'input': test_value,
-                                      'inputType': start_type,
-                                      'outputType': intermediate_type
-                                  }),
-                                  content_type='application/json')
-            
-            data1 = json.loads(response1.data)
-            assert data1['error'] is None
-            
-            # Second conversion back
-            response2 = client.post('/convert',
-                                  data=json.dumps({
-                                      'input': data1['result'],
-                                      'inputType': end_type,
-                                      'outputType': final_type
-                                  }),
-                                  content_type='application/json')
-            
-            data2 = json.loads(response2.data)
-            assert data2['error'] is None
-            assert data2['result'] == test_value
+        # First conversion
+        response1 = client.post('/convert', json={
+            'input': test_value,
+            'inputType': start_type,
+            'outputType': intermediate_type
+        })
+        
+        data1 = response1.get_json()
+        assert data1['error'] is None
+        
+        # Second conversion back
+        response2 = client.post('/convert', json={
+            'input': data1['result'],
+            'inputType': end_type,
+            'outputType': final_type
+        })
+        
+        data2 = response2.get_json()
+        assert data2['error'] is None
+        assert data2['result'] == test_value
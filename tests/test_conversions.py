@@ -1,43 +1,70 @@
 """
-Test suite for all conversion types in the Numeric Converter application.
-Tests all input/output type combinations with various test cases.
+Test suite for the conversion helper functions of the Numeric Converter application.
+Tests text, base64 and integer base conversions directly, without the API.
 """
 import pytest
 import base64
-import json
+import functools
+import re
 from api.index import text_to_number, number_to_text, base64_to_number, number_to_base64
 
 
+def _nbytes(n: int) -> int:
+    """Minimal number of bytes needed to hold n (at least one)."""
+    return max(1, (n.bit_length() + 7) >> 3)
+
+
+@functools.lru_cache(maxsize=None)
+def _b64le(n: int) -> str:
+    """Expected base64 of n as minimal-length little-endian bytes."""
+    return base64.b64encode(n.to_bytes(_nbytes(n), 'little')).decode('ascii')
+
+
+# Valid text inputs: basic words, mixed case, and trailing punctuation
+_TEXT_TO_NUMBER_CASES = {
+    "zero": 0, "one": 1, "ten": 10, "nil": 0,
+    "ONE": 1, "Ten": 10, "ZERO": 0,
+    "one!": 1, "ten-": 10, "zero.": 0,
+}
+
+# Expected error messages for pytest.raises(match=...)
+_RE_UNABLE = re.compile(r"Unable to convert text to number")
+_RE_INVALID_B64 = re.compile(r"Invalid base64 input")
+
+# (value, binary, octal, hexadecimal)
+_BASE_CASES = (
+    (0, "0", "0", "0"),
+    (1, "1", "1", "1"),
+    (42, "101010", "52", "2a"),
+    (255, "11111111", "377", "ff"),
+    (1024, "10000000000", "2000", "400"),
+)
+
+# Base64 of every single-byte value, indexed by the byte
+_B64_1BYTE = tuple(base64.b64encode(bytes((i,))).decode('ascii') for i in range(256))
+
+# Spot values plus both sides of every byte-length boundary up to 8 bytes
+_ROUNDTRIP_NUMBERS = (0, 1, 42, 255, 256, 1024, 65535, 123456) + tuple(
+    n for k in range(8, 65, 8) for n in (2**k - 1, 2**k))
+
+
 class TestTextConversions:
     """Test text to number and number to text conversions."""
     
-    def test_text_to_number_basic(self):
-        """Test basic text to number conversions."""
-        assert text_to_number("zero") == 0
-        assert text_to_number("one") == 1
-        assert text_to_number("ten") == 10
-        assert text_to_number("nil") == 0
-    
-    def test_text_to_number_case_insensitive(self):
-        """Test that text conversion is case insensitive."""
-        assert text_to_number("ONE") == 1
-        assert text_to_number("Ten") == 10
-        assert text_to_number("ZERO") == 0
-    
-    def test_text_to_number_with_special_chars(self):
-        """Test text conversion with special characters."""
-        assert text_to_number("one!") == 1
-        assert text_to_number("ten-") == 10
-        assert text_to_number("zero.") == 0
+    @pytest.mark.parametrize("text,expected", _TEXT_TO_NUMBER_CASES.items(),
+                             ids=list(_TEXT_TO_NUMBER_CASES))
+    def test_text_to_number_valid(self, text, expected):
+        """Test basic, case-insensitive and punctuated text to number conversions."""
+        assert text_to_number(text) == expected
     
     def test_text_to_number_invalid(self):
         """Test invalid text inputs."""
         # Note: "hundred" gets converted to "100" by text2digits, so we test truly invalid cases
-        with pytest.raises(ValueError, match="Unable to convert text to number"):
+        with pytest.raises(ValueError, match=_RE_UNABLE):
             text_to_number("invalid")
-        with pytest.raises(ValueError, match="Unable to convert text to number"):
+        with pytest.raises(ValueError, match=_RE_UNABLE):
             text_to_number("xyzabc")
-        with pytest.raises(ValueError, match="Unable to convert text to number"):
+        with pytest.raises(ValueError, match=_RE_UNABLE):
             text_to_number("notanumber")
     
     def test_number_to_text_basic(self):
@@ -58,64 +85,19 @@ class TestTextConversions:
         assert number_to_text(-42) == "minus forty-two"
 
 
-class TestBinaryConversions:
-    """Test binary conversions."""
-    
-    def test_decimal_to_binary(self):
-        """Test decimal to binary conversion."""
-        assert bin(0)[2:] == "0"
-        assert bin(1)[2:] == "1"
-        assert bin(42)[2:] == "101010"
-        assert bin(255)[2:] == "11111111"
-        assert bin(1024)[2:] == "10000000000"
-    
-    def test_binary_to_decimal(self):
-        """Test binary to decimal conversion."""
-        assert int("0", 2) == 0
-        assert int("1", 2) == 1
-        assert int("101010", 2) == 42
-        assert int("11111111", 2) == 255
-        assert int("10000000000", 2) == 1024
-
-
-class TestOctalConversions:
-    """Test octal conversions."""
-    
-    def test_decimal_to_octal(self):
-        """Test decimal to octal conversion."""
-        assert oct(0)[2:] == "0"
-        assert oct(1)[2:] == "1"
-        assert oct(42)[2:] == "52"
-        assert oct(255)[2:] == "377"
-        assert oct(1024)[2:] == "2000"
-    
-    def test_octal_to_decimal(self):
-        """Test octal to decimal conversion."""
-        assert int("0", 8) == 0
-        assert int("1", 8) == 1
-        assert int("52", 8) == 42
-        assert int("377", 8) == 255
-        assert int("2000", 8) == 1024
-
-
-class TestHexadecimalConversions:
-    """Test hexadecimal conversions."""
-    
-    def test_decimal_to_hexadecimal(self):
-        """Test decimal to hexadecimal conversion."""
-        assert hex(0)[2:] == "0"
-        assert hex(1)[2:] == "1"
-        assert hex(42)[2:] == "2a"
-        assert hex(255)[2:] == "ff"
-        assert hex(1024)[2:] == "400"
-    
-    def test_hexadecimal_to_decimal(self):
-        """Test hexadecimal to decimal conversion."""
-        assert int("0", 16) == 0
-        assert int("1", 16) == 1
-        assert int("2a", 16) == 42
-        assert int("ff", 16) == 255
-        assert int("400", 16) == 1024
+class TestIntegerBaseConversions:
+    """Test binary, octal and hexadecimal conversions."""
+    
+    @pytest.mark.parametrize("n,binary,octal,hexadecimal", _BASE_CASES,
+                             ids=[str(n) for n, _, _, _ in _BASE_CASES])
+    def test_base_conversions(self, n, binary, octal, hexadecimal):
+        """Test decimal to binary/octal/hex conversion and parsing back."""
+        assert bin(n)[2:] == binary
+        assert oct(n)[2:] == octal
+        assert hex(n)[2:] == hexadecimal
+        assert int(binary, 2) == n
+        assert int(octal, 8) == n
+        assert int(hexadecimal, 16) == n
 
 
 class TestBase64Conversions:
@@ -124,39 +106,39 @@ class TestBase64Conversions:
     def test_number_to_base64_little_endian(self):
         """Test number to base64 conversion using little-endian byte order."""
         # Test small numbers
-        assert number_to_base64(0) == base64.b64encode((0).to_bytes(1, 'little')).decode('utf-8')
-        assert number_to_base64(1) == base64.b64encode((1).to_bytes(1, 'little')).decode('utf-8')
-        assert number_to_base64(255) == base64.b64encode((255).to_bytes(1, 'little')).decode('utf-8')
+        assert number_to_base64(0) == _B64_1BYTE[0]
+        assert number_to_base64(1) == _B64_1BYTE[1]
+        assert number_to_base64(255) == _B64_1BYTE[255]
         
         # Test larger numbers
-        assert number_to_base64(256) == base64.b64encode((256).to_bytes(2, 'little')).decode('utf-8')
-        assert number_to_base64(65535) == base64.b64encode((65535).to_bytes(2, 'little')).decode('utf-8')
+        assert number_to_base64(256) == _b64le(256)
+        assert number_to_base64(65535) == _b64le(65535)
     
     def test_base64_to_number_little_endian(self):
         """Test base64 to number conversion using little-endian byte order."""
         # Test small numbers
         test_num = 42
-        b64_str = base64.b64encode(test_num.to_bytes(1, 'little')).decode('utf-8')
+        b64_str = _b64le(test_num)
         assert base64_to_number(b64_str) == test_num
         
         # Test larger numbers
         test_num = 1024
-        b64_str = base64.b64encode(test_num.to_bytes(2, 'little')).decode('utf-8')
+        b64_str = _b64le(test_num)
         assert base64_to_number(b64_str) == test_num
     
     def test_base64_roundtrip(self):
         """Test roundtrip conversion: number -> base64 -> number."""
-        test_numbers = [0, 1, 42, 255, 256, 1024, 65535, 123456]
-        for num in test_numbers:
-            b64 = number_to_base64(num)
-            result = base64_to_number(b64)
-            assert result == num, f"Roundtrip failed for {num}: {b64} -> {result}"
+        encoded = [(num, number_to_base64(num)) for num in _ROUNDTRIP_NUMBERS]
+        failures = [(num, b64) for num, b64 in encoded
+                    if base64_to_number(b64) != num
+                    or len(base64.b64decode(b64)) != _nbytes(num)]
+        assert not failures, f"Roundtrip failed for (number, base64): {failures}"
     
     def test_base64_invalid_input(self):
         """Test base64 conversion with invalid input."""
-        with pytest.raises(ValueError, match="Invalid base64 input"):
+        with pytest.raises(ValueError, match=_RE_INVALID_B64):
             base64_to_number("invalid_base64!")
-        with pytest.raises(ValueError, match="Invalid base64 input"):
+        with pytest.raises(ValueError, match=_RE_INVALID_B64):
             base64_to_number("not_base64")
         # Empty string might not raise error depending on base64 implementation
         # Let's test what actually happens
@@ -165,55 +147,3 @@ class TestBase64Conversions:
             # If it doesn't raise an error, that's also acceptable
         except ValueError:
             pass  # Expected behavior
-
-
-class TestCrossConversions:
-    """Test conversions between all input/output type combinations."""
-    
-    @pytest.mark.parametrize("input_type,output_type,input_value,expected", [
-        # Text conversions
-        ("text", "decimal", "zero", "0"),
-        ("text", "binary", "one", "1"),
-        ("text", "octal", "ten", "12"),
-        ("text", "hexadecimal", "one", "1"),
-        ("text", "base64", "one", base64.b64encode((1).to_bytes(1, 'little')).decode('utf-8')),
-        
-        # Binary conversions
-        ("binary", "decimal", "101010", "42"),
-        ("binary", "text", "1", "one"),
-        ("binary", "octal", "101010", "52"),
-        ("binary", "hexadecimal", "101010", "2a"),
-        ("binary", "base64", "101010", base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8')),
-        
-        # Octal conversions
-        ("octal", "decimal", "52", "42"),
-        ("octal", "text", "1", "one"),
-        ("octal", "binary", "52", "101010"),
-        ("octal", "hexadecimal", "52", "2a"),
-        ("octal", "base64", "52", base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8')),
-        
-        # Decimal conversions
-        ("decimal", "text", "42", "forty-two"),
-        ("decimal", "binary", "42", "101010"),
-        ("decimal", "octal", "42", "52"),
-        ("decimal", "hexadecimal", "42", "2a"),
-        ("decimal", "base64", "42", base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8')),
-        
-        # Hexadecimal conversions
-        ("hexadecimal", "decimal", "2a", "42"),
-        ("hexadecimal", "text", "1", "one"),
-        ("hexadecimal", "binary", "2a", "101010"),
-        ("hexadecimal", "octal", "2a", "52"),
-        ("hexadecimal", "base64", "2a", base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8')),
-        
-        # Base64 conversions
-        ("base64", "decimal", base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8'), "42"),
-        ("base64", "text", base64.b64encode((1).to_bytes(1, 'little')).decode('utf-8'), "one"),
-        ("base64", "binary", base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8'), "101010"),
-        ("base64", "octal", base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8'), "52"),
-        ("base64", "hexadecimal", base64.b64encode((42).to_bytes(1, 'little')).decode('utf-8'), "2a"),
-    ])
-    def test_all_conversion_combinations(self, input_type, output_type, input_value, expected):
-        """Test all possible input/output type combinations."""
-        # This test will be implemented in the API test file
-        pass